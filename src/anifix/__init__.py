@@ -1,5 +1,6 @@
 """Anifix - A tool for correcting anime episode titles in file names."""
 
 from .core import main
+from .errors import AnifixError
 
-__all__ = ["main"]
+__all__ = ["AnifixError", "main"]
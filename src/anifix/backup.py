@@ -1,29 +1,127 @@
 """Backup and restore functionality for anifix."""
 
 import json
+import os
 from pathlib import Path
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+BACKUP_FILENAME = ".anifix-backup.json"
+BACKUP_JOURNAL_FILENAME = ".anifix-backup.jsonl"
+
+
+# Pick the serializer once at import time rather than on every call
+if ORJSON_AVAILABLE:
+
+    def _dumps(data: object) -> bytes:
+        """Serialize data to compact JSON with orjson."""
+        return orjson.dumps(data)
+
+    def _loads(raw: bytes) -> Any:  # noqa: ANN401
+        """Deserialize JSON data with orjson."""
+        return orjson.loads(raw)
+
+else:
+
+    def _dumps(data: object) -> bytes:
+        """Serialize data to compact JSON."""
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def _loads(raw: bytes) -> Any:  # noqa: ANN401
+        """Deserialize JSON data."""
+        return json.loads(raw)
 
 
 def load_backup_file(directory: Path) -> dict[str, str]:
-    """Load the backup file mapping current names to original names."""
-    backup_file = directory / ".anifix-backup.json"
-    if not backup_file.exists():
-        return {}
+    """
+    Load the backup file mapping current names to original names.
+
+    Renames recorded in a leftover journal (from a run that didn't finish) are
+    applied on top of the backup file.
+    """
+    backup_file = directory / BACKUP_FILENAME
+    backup_data: dict[str, str] = {}
 
     try:
-        with backup_file.open() as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError) as e:
+        raw = backup_file.read_bytes()
+    except FileNotFoundError:
+        raw = b""
+    except OSError as e:
         print(f"Warning: Could not read backup file: {e}")
-        return {}
+        raw = b""
+
+    # Only a JSON object is worth parsing, an empty file just means no backup
+    content = raw.lstrip()
+    if content.startswith(b"{"):
+        try:
+            backup_data = _loads(raw)
+        except ValueError as e:
+            print(f"Warning: Could not read backup file: {e}")
+    elif content:
+        print("Warning: Could not read backup file: expected a JSON object")
+
+    _replay_backup_journal(directory / BACKUP_JOURNAL_FILENAME, backup_data)
+    return backup_data
+
+
+def _replay_backup_journal(journal_file: Path, backup_data: dict[str, str]) -> None:
+    """Apply the renames recorded in a backup journal to the backup data."""
+    try:
+        with journal_file.open("rb") as f:
+            for line in f:
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    # A torn final line from an interrupted write, nothing follows it
+                    break
+                backup_data.pop(entry["old"], None)
+                backup_data[entry["new"]] = entry["orig"]
+    except FileNotFoundError:
+        return
+    except (OSError, KeyError, TypeError) as e:
+        print(f"Warning: Could not read backup journal: {e}")
+
+
+def open_backup_journal(directory: Path) -> BinaryIO | None:
+    """Open the backup journal for appending, or return None if it can't be opened."""
+    journal_file = directory / BACKUP_JOURNAL_FILENAME
+    try:
+        return journal_file.open("ab", buffering=0)
+    except OSError as e:
+        print(f"Warning: Could not write backup journal: {e}")
+        return None
+
+
+def write_backup_entry(
+    journal: BinaryIO,
+    old_name: str,
+    new_name: str,
+    original_name: str,
+) -> None:
+    """Record a single rename in an open backup journal as soon as it happens."""
+    entry = {"old": old_name, "new": new_name, "orig": original_name}
+    try:
+        journal.write(_dumps(entry) + b"\n")
+    except OSError as e:
+        print(f"Warning: Could not write backup journal: {e}")
 
 
 def save_backup_file(directory: Path, backup_data: dict[str, str]) -> None:
-    """Save the backup file mapping current names to original names."""
-    backup_file = directory / ".anifix-backup.json"
+    """
+    Save the backup file mapping current names to original names.
+
+    Once the backup file is written, the journal it supersedes is removed.
+    """
+    backup_file = directory / BACKUP_FILENAME
     try:
-        with backup_file.open("w") as f:
-            json.dump(backup_data, f, indent=2)
+        backup_file.write_bytes(_dumps(backup_data))
+        (directory / BACKUP_JOURNAL_FILENAME).unlink(missing_ok=True)
     except OSError as e:
         print(f"Warning: Could not save backup file: {e}")
 
@@ -34,14 +132,8 @@ def update_backup_data(
     new_name: str,
 ) -> None:
     """Update backup data when renaming a file."""
-    # Check if this file was already renamed before
-    original_name = old_name
-    for current, orig in list(backup_data.items()):
-        if current == old_name:
-            # This file was already renamed, use its original name
-            original_name = orig
-            del backup_data[current]
-            break
+    # If this file was already renamed before, carry over its original name
+    original_name = backup_data.pop(old_name, old_name)
 
     # Store the mapping from new name to original name
     backup_data[new_name] = original_name
@@ -59,16 +151,17 @@ def restore_files(directory: Path) -> None:
     restored_count = 0
     failed_count = 0
 
+    dir_str = os.fspath(directory)
     for current_name, original_name in backup_data.items():
-        current_path = directory / current_name
-        original_path = directory / original_name
+        current_path = os.path.join(dir_str, current_name)
+        original_path = os.path.join(dir_str, original_name)
 
-        if not current_path.exists():
+        if not os.path.exists(current_path):
             print(f"Warning: File '{current_name}' not found, skipping")
             failed_count += 1
             continue
 
-        if original_path.exists() and original_path != current_path:
+        if original_path != current_path and os.path.exists(original_path):
             print(
                 f"Warning: Target '{original_name}' already exists, skipping '{current_name}'",
             )
@@ -77,7 +170,7 @@ def restore_files(directory: Path) -> None:
 
         try:
             print(f"Restoring: {current_name} -> {original_name}")
-            current_path.rename(original_path)
+            os.replace(current_path, original_path)
             restored_count += 1
         except OSError as e:
             print(f"Error restoring '{current_name}': {e}")
@@ -85,9 +178,9 @@ def restore_files(directory: Path) -> None:
 
     if restored_count > 0:
         # Remove the backup file after successful restoration
-        backup_file = directory / ".anifix-backup.json"
         try:
-            backup_file.unlink()
+            (directory / BACKUP_FILENAME).unlink(missing_ok=True)
+            (directory / BACKUP_JOURNAL_FILENAME).unlink(missing_ok=True)
             print(f"\nRestored {restored_count} files and removed backup file")
         except OSError:
             print(f"\nRestored {restored_count} files (backup file removal failed)")
@@ -1,9 +1,10 @@
 """Command-line interface and argument parsing for anifix."""
 
 import argparse
-import sys
 from pathlib import Path
 
+from anifix.errors import AnifixError
+
 
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
@@ -67,11 +68,11 @@ Examples:
 def validate_directory(directory: Path) -> None:
     """Validate that the provided directory exists and is actually a directory."""
     if not directory.exists():
-        print(f"Error: Directory '{directory}' does not exist")
-        sys.exit(1)
+        msg = f"Directory '{directory}' does not exist"
+        raise AnifixError(msg)
     if not directory.is_dir():
-        print(f"Error: '{directory}' is not a directory")
-        sys.exit(1)
+        msg = f"'{directory}' is not a directory"
+        raise AnifixError(msg)
 
 
 def find_spec_file(directory: Path, spec_file_arg: Path | None) -> Path:
@@ -79,8 +80,8 @@ def find_spec_file(directory: Path, spec_file_arg: Path | None) -> Path:
     if spec_file_arg:
         spec_file = spec_file_arg.resolve()
         if not spec_file.exists():
-            print(f"Error: Spec file '{spec_file}' not found")
-            sys.exit(1)
+            msg = f"Spec file '{spec_file}' not found"
+            raise AnifixError(msg)
         return spec_file
 
     # Try different spec file names in order of preference
@@ -90,16 +91,18 @@ def find_spec_file(directory: Path, spec_file_arg: Path | None) -> Path:
         if candidate.exists():
             return candidate
 
-    print("Error: No spec file found in target directory")
-    print("Create a spec file with one of these names:")
-    print("  - anifix.spec")
-    print("  - .anifix")
-    print("  - anifix")
-    print("With the format:")
-    print("# Season | Episode range")
-    print("1 | 1-12")
-    print("2 | 13-24")
-    sys.exit(1)
+    msg = (
+        "No spec file found in target directory\n"
+        "Create a spec file with one of these names:\n"
+        "  - anifix.spec\n"
+        "  - .anifix\n"
+        "  - anifix\n"
+        "With the format:\n"
+        "# Season | Episode range\n"
+        "1 | 1-12\n"
+        "2 | 13-24"
+    )
+    raise AnifixError(msg)
 
 
 def print_verbose_info(
@@ -111,5 +114,9 @@ def print_verbose_info(
     print(f"Working directory: {working_dir}")
     print(f"Using spec file: {spec_file}")
     print(f"Found {len(season_map)} season(s) in spec file")
-    for season, (start, end) in season_map.items():
-        print(f"  Season {season}: Episodes {start}-{end}")
+    print(
+        "\n".join(
+            f"  Season {season}: Episodes {start}-{end}"
+            for season, (start, end) in season_map.items()
+        ),
+    )
@@ -10,6 +10,7 @@ from anifix.cli import (
     print_verbose_info,
     validate_directory,
 )
+from anifix.errors import AnifixError
 from anifix.renamer import rename_episode_files
 from anifix.spec import parse_spec_file
 
@@ -26,16 +27,16 @@ def main() -> None:
     parser = create_argument_parser()
     args = parser.parse_args()
 
-    # Validate working directory
-    working_dir = args.directory.resolve()
-    validate_directory(working_dir)
+    try:
+        # Validate working directory
+        working_dir = args.directory.resolve()
+        validate_directory(working_dir)
 
-    # Handle restore mode
-    if args.restore:
-        restore_files(working_dir)
-        return
+        # Handle restore mode
+        if args.restore:
+            restore_files(working_dir)
+            return
 
-    try:
         # Handle URL spec mode (scrape and use in-memory)
         if args.url_spec:
             season_map = handle_url_spec(args)
@@ -46,14 +47,22 @@ def main() -> None:
             season_map = parse_spec_file(spec_file)
             spec_source = f"spec file: {spec_file.name}"
 
+        if not season_map:
+            msg = f"No seasons found in {spec_source}"
+            raise AnifixError(msg)
+
         # Print information based on verbosity settings
         if args.verbose:
             if args.url_spec:
                 print(f"Working directory: {working_dir}")
                 print(f"Using TVDB URL: {args.url_spec}")
                 print(f"Found {len(season_map)} season(s)")
-                for season, (start, end) in season_map.items():
-                    print(f"  Season {season}: Episodes {start}-{end}")
+                print(
+                    "\n".join(
+                        f"  Season {season}: Episodes {start}-{end}"
+                        for season, (start, end) in season_map.items()
+                    ),
+                )
             else:
                 print_verbose_info(working_dir, spec_file, season_map)
         elif not args.dry_run:
@@ -70,6 +79,6 @@ def main() -> None:
         if not args.dry_run:
             print("Done!")
 
-    except (ValueError, FileNotFoundError) as e:
+    except (AnifixError, ValueError, FileNotFoundError) as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -1,23 +1,87 @@
 """Episode number extraction and season mapping for anifix."""
 
-import re
+import bisect
+import functools
+import sys
+from typing import NamedTuple
+
+# Use the RE2 (DFA-based) engine when google-re2 is installed. Both engines share
+# the compile/match/group API; flags are written inline so they work in either.
+try:
+    import re2 as _re  # type: ignore[import-not-found,import-untyped]
+except ImportError:
+    import re as _re
+
+_EP_TITLE_RE = _re.compile(r"(?i)Episode\s+(\d+)\s*-\s*(.+)")
+_EP_TITLE_FALLBACK_RE = _re.compile(r"\d+\s*-?\s*(.+)")
+
+
+def _leading_number(text: str, start: int) -> int | None:
+    """Parse the run of digits starting at text[start], or None if there isn't one."""
+    end = start
+    while end < len(text) and text[end].isdecimal():
+        end += 1
+    return int(text[start:end]) if end > start else None
 
 
 def get_episode_number_from_filename(filename: str) -> int:
     """Extract episode number from filename like 'Episode 1 - Title.mkv'."""
-    match = re.match(r"Episode\s+(\d+)", filename, re.IGNORECASE)
-    if match:
-        return int(match.group(1))
+    # Scan by hand rather than with a regex, these names are short and simple
+    if filename[:7].lower() == "episode":
+        i = 7
+        while i < len(filename) and filename[i].isspace():
+            i += 1
+        if i > 7:
+            number = _leading_number(filename, i)
+            if number is not None:
+                return number
 
     # Fallback: look for any number at the start
-    match = re.match(r"(\d+)", filename)
-    if match:
-        return int(match.group(1))
+    number = _leading_number(filename, 0)
+    if number is not None:
+        return number
 
     msg = f"Could not extract episode number from: {filename}"
     raise ValueError(msg)
 
 
+class SeasonIndex(NamedTuple):
+    """Season ranges sorted by start episode, as parallel tuples for bisect lookups."""
+
+    starts: tuple[int, ...]
+    ends: tuple[int, ...]
+    seasons: tuple[int, ...]
+
+
+def build_season_index(season_map: dict[int, tuple[int, int]]) -> SeasonIndex:
+    """
+    Build a sorted index of season ranges for bisect lookups.
+
+    Its size depends on the number of seasons rather than the highest episode number.
+    """
+    ranges = sorted((start, end, season) for season, (start, end) in season_map.items())
+    if not ranges:
+        return SeasonIndex((), (), ())
+    starts, ends, seasons = zip(*ranges, strict=True)
+    return SeasonIndex(starts, ends, seasons)
+
+
+def lookup_season_in_index(episode_num: int, index: SeasonIndex) -> tuple[int, int]:
+    """
+    Find an episode's season in an index built by build_season_index.
+
+    Returns:
+        Tuple of (season_number, episode_in_season)
+
+    """
+    i = bisect.bisect_right(index.starts, episode_num) - 1
+    if i >= 0 and episode_num <= index.ends[i]:
+        return index.seasons[i], episode_num - index.starts[i] + 1
+
+    msg = f"Episode {episode_num} not found in any season"
+    raise ValueError(msg)
+
+
 def find_season_for_episode(
     episode_num: int,
     season_map: dict[int, tuple[int, int]],
@@ -29,10 +93,11 @@ def find_season_for_episode(
         Tuple of (season_number, episode_in_season)
 
     """
+    # A one-off lookup isn't worth building an index for, and scanning keeps the
+    # first-match behaviour for maps that skipped validation
     for season, (start, end) in season_map.items():
         if start <= episode_num <= end:
-            episode_in_season = episode_num - start + 1
-            return season, episode_in_season
+            return season, episode_num - start + 1
 
     msg = f"Episode {episode_num} not found in any season"
     raise ValueError(msg)
@@ -41,16 +106,12 @@ def find_season_for_episode(
 def extract_episode_title(filename: str) -> str:
     """Extract the title part from an episode filename."""
     # Extract the title part (everything after "Episode X - ")
-    title_match = re.match(
-        r"Episode\s+\d+\s*-\s*(.+)",
-        filename,
-        re.IGNORECASE,
-    )
+    title_match = _EP_TITLE_RE.match(filename)
     if title_match:
-        return title_match.group(1)
+        return title_match.group(2)
 
     # Fallback: use everything after the episode number
-    title_match = re.match(r"\d+\s*-?\s*(.+)", filename)
+    title_match = _EP_TITLE_FALLBACK_RE.match(filename)
     if title_match:
         return title_match.group(1)
 
@@ -58,6 +119,30 @@ def extract_episode_title(filename: str) -> str:
     return filename.rsplit(".", 1)[0] if "." in filename else filename
 
 
+def parse_episode_filename(filename: str) -> tuple[int, str]:
+    """
+    Extract both the episode number and title from a filename.
+
+    Standard 'Episode X - Title.mkv' names are handled with a single regex match,
+    anything else falls back to the separate number and title extraction.
+
+    Returns:
+        Tuple of (episode_number, title)
+
+    """
+    match = _EP_TITLE_RE.match(filename)
+    if match:
+        return int(match.group(1)), match.group(2)
+
+    return get_episode_number_from_filename(filename), extract_episode_title(filename)
+
+
+@functools.cache
+def _season_prefix(season: int) -> str:
+    """Build the shared 'S01E' prefix for a season's episode names."""
+    return sys.intern(f"S{season:02d}E")
+
+
 def format_episode_name(season: int, episode_in_season: int, title: str) -> str:
     """Format episode name in Jellyfin-compatible format: S01E01 - Title."""
-    return f"S{season:02d}E{episode_in_season:02d} - {title}"
+    return f"{_season_prefix(season)}{episode_in_season:02d} - {title}"
@@ -0,0 +1,5 @@
+"""Exception types for anifix."""
+
+
+class AnifixError(Exception):
+    """An error that should stop anifix and be reported to the user."""
@@ -1,76 +1,259 @@
 """File renaming functionality for anifix."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import BinaryIO
 
-from anifix.backup import load_backup_file, save_backup_file, update_backup_data
+from anifix.backup import (
+    load_backup_file,
+    open_backup_journal,
+    save_backup_file,
+    update_backup_data,
+    write_backup_entry,
+)
 from anifix.episode import (
-    extract_episode_title,
-    find_season_for_episode,
+    build_season_index,
     format_episode_name,
-    get_episode_number_from_filename,
+    lookup_season_in_index,
+    parse_episode_filename,
 )
 
-VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".mov", ".m4v", ".wmv"}
+VIDEO_EXTENSIONS = frozenset({".mkv", ".mp4", ".avi", ".mov", ".m4v", ".wmv"})
 
+# Plans this long are renamed on a thread pool, so slow filesystems (network
+# shares, FUSE mounts) can work on several renames at once. The renames wait on
+# I/O rather than the CPU, so the pool size doesn't depend on the core count
+CONCURRENT_RENAME_THRESHOLD = 32
+MAX_RENAME_WORKERS = 8
 
-def should_process_file(file_path: Path) -> bool:
-    """Check if a file should be processed for renaming."""
-    return file_path.is_file() and file_path.suffix.lower() in VIDEO_EXTENSIONS
 
+def should_process_file(entry: os.DirEntry[str]) -> bool:
+    """Check if a directory entry should be processed for renaming."""
+    # Check the extension first, is_file() may need a stat call
+    return (
+        os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS and entry.is_file()
+    )
 
-def rename_episode_files(
+
+def build_rename_plan(
     directory: Path,
     season_map: dict[int, tuple[int, int]],
-    *,
-    dry_run: bool = False,
-) -> None:
-    """Rename episode files in the directory according to the season mapping."""
-    # Load existing backup data
-    backup_data = load_backup_file(directory) if not dry_run else {}
-    backup_updated = False
+) -> tuple[list[tuple[str, str]], list[str]]:
+    """
+    Work out which episode files to rename, without touching anything on disk.
 
-    for file_path in directory.iterdir():
-        if not should_process_file(file_path):
-            continue
+    Returns:
+        Tuple of (plan, warnings), where plan lists (current_name, new_name) pairs
+        and warnings describe files that couldn't be processed
+
+    """
+    season_index = build_season_index(season_map)
+    with os.scandir(directory) as entries:
+        names = [entry.name for entry in entries if should_process_file(entry)]
 
+    plan: list[tuple[str, str]] = []
+    warnings: list[str] = []
+    planned_targets: dict[str, str] = {}  # new_name -> current_name
+
+    for name in names:
         try:
-            # Extract episode number from current filename
-            episode_num = get_episode_number_from_filename(file_path.name)
+            # Extract episode number and title from current filename
+            episode_num, title = parse_episode_filename(name)
 
             # Find which season this episode belongs to
-            season, episode_in_season = find_season_for_episode(
+            season, episode_in_season = lookup_season_in_index(
                 episode_num,
-                season_map,
+                season_index,
             )
+        except ValueError as e:
+            warnings.append(f"Warning: Could not process {name}: {e}")
+            continue
 
-            # Extract the title part
-            title = extract_episode_title(file_path.name)
+        # Create new filename: S01E01 - Title.ext
+        new_name = format_episode_name(season, episode_in_season, title)
 
-            # Create new filename: S01E01 - Title.ext
-            new_name = format_episode_name(season, episode_in_season, title)
-            new_path = file_path.parent / new_name
+        # Skip if the file is already renamed to the target format
+        if name == new_name:
+            continue
 
-            # Skip if the file is already renamed to the target format
-            if file_path.name == new_name:
-                continue
+        # Two files mapping to the same name would overwrite each other
+        if new_name in planned_targets:
+            warnings.append(
+                f"Warning: Could not process {name}: "
+                f"'{planned_targets[new_name]}' is also being renamed to '{new_name}'",
+            )
+            continue
 
-            # Rename the file or show preview
-            if dry_run:
-                print(f"Would rename: {file_path.name} -> {new_name}")
-            else:
-                print(f"Renaming: {file_path.name} -> {new_name}")
+        planned_targets[new_name] = name
+        plan.append((name, new_name))
 
-                # Update backup data if this is not a dry run
-                if new_name not in backup_data:
-                    update_backup_data(backup_data, file_path.name, new_name)
-                    backup_updated = True
+    return plan, warnings
 
-                file_path.rename(new_path)
 
-        except (ValueError, FileExistsError) as e:
-            print(f"Warning: Could not process {file_path.name}: {e}")
-            continue
+def execute_rename_plan(
+    directory: Path,
+    plan: list[tuple[str, str]],
+    *,
+    dry_run: bool = False,
+) -> None:
+    """Carry out (or preview) the renames from build_rename_plan."""
+    # Nothing to rename (e.g. a re-run), so leave the backup file alone
+    if not plan:
+        return
+
+    if dry_run:
+        for current_name, new_name in plan:
+            print(f"Would rename: {current_name} -> {new_name}")
+        return
+
+    # Load existing backup data
+    backup_data = load_backup_file(directory)
+
+    # Renames can only run concurrently if none of them targets another's source
+    sources = {current_name for current_name, _ in plan}
+    if len(plan) >= CONCURRENT_RENAME_THRESHOLD and sources.isdisjoint(
+        new_name for _, new_name in plan
+    ):
+        backup_updated = _rename_concurrently(directory, plan, backup_data)
+    else:
+        backup_updated = _rename_serially(directory, plan, backup_data)
 
     # Save backup data if it was updated
-    if backup_updated and not dry_run:
+    if backup_updated:
         save_backup_file(directory, backup_data)
+
+
+def _rename_serially(
+    directory: Path,
+    plan: list[tuple[str, str]],
+    backup_data: dict[str, str],
+) -> bool:
+    """
+    Rename files one at a time, recording each rename in the backup data.
+
+    Returns:
+        True if the backup data was updated
+
+    """
+    backup_updated = False
+    dir_str = os.fspath(directory)
+
+    # The journal is opened on the first successful rename and kept open for the rest
+    journal: BinaryIO | None = None
+    try:
+        for current_name, new_name in plan:
+            print(f"Renaming: {current_name} -> {new_name}")
+            try:
+                os.replace(
+                    os.path.join(dir_str, current_name),
+                    os.path.join(dir_str, new_name),
+                )
+            except OSError as e:
+                print(f"Warning: Could not process {current_name}: {e}")
+                continue
+
+            # Record the rename straight away so an interrupted run can be restored
+            if new_name not in backup_data:
+                update_backup_data(backup_data, current_name, new_name)
+                if journal is None:
+                    journal = open_backup_journal(directory)
+                if journal is not None:
+                    write_backup_entry(
+                        journal,
+                        current_name,
+                        new_name,
+                        backup_data[new_name],
+                    )
+                backup_updated = True
+    finally:
+        if journal is not None:
+            journal.close()
+
+    return backup_updated
+
+
+def _rename_concurrently(
+    directory: Path,
+    plan: list[tuple[str, str]],
+    backup_data: dict[str, str],
+) -> bool:
+    """
+    Rename files on a thread pool, then record the results in plan order.
+
+    The plan's sources and targets must not overlap, so the renames don't depend
+    on each other.
+
+    Returns:
+        True if the backup data was updated
+
+    """
+    dir_str = os.fspath(directory)
+
+    # Work out original names up front, as the serial loop would see them
+    originals = {
+        current_name: backup_data.get(current_name, current_name)
+        for current_name, new_name in plan
+        if new_name not in backup_data
+    }
+    journal = open_backup_journal(directory) if originals else None
+
+    def _rename(names: tuple[str, str]) -> OSError | None:
+        current_name, new_name = names
+        try:
+            os.replace(
+                os.path.join(dir_str, current_name),
+                os.path.join(dir_str, new_name),
+            )
+        except OSError as e:
+            return e
+
+        # Journal from the worker so an interrupted run can be restored. The
+        # journal is unbuffered, so each entry is a single append
+        if journal is not None and current_name in originals:
+            write_backup_entry(
+                journal,
+                current_name,
+                new_name,
+                originals[current_name],
+            )
+        return None
+
+    backup_updated = False
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_RENAME_WORKERS) as executor:
+            # Announce each rename before submitting it, as the serial loop does,
+            # so an interrupted run never hides a rename that already happened
+            futures = []
+            for names in plan:
+                print(f"Renaming: {names[0]} -> {names[1]}")
+                futures.append(executor.submit(_rename, names))
+
+            for (current_name, new_name), future in zip(plan, futures, strict=True):
+                error = future.result()
+                if error is not None:
+                    print(f"Warning: Could not process {current_name}: {error}")
+                    continue
+
+                if current_name in originals:
+                    update_backup_data(backup_data, current_name, new_name)
+                    backup_updated = True
+    finally:
+        if journal is not None:
+            journal.close()
+
+    return backup_updated
+
+
+def rename_episode_files(
+    directory: Path,
+    season_map: dict[int, tuple[int, int]],
+    *,
+    dry_run: bool = False,
+) -> None:
+    """Rename episode files in the directory according to the season mapping."""
+    plan, warnings = build_rename_plan(directory, season_map)
+    for warning in warnings:
+        print(warning)
+
+    execute_rename_plan(directory, plan, dry_run=dry_run)
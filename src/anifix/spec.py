@@ -1,5 +1,6 @@
 """Spec file parsing and validation for anifix."""
 
+import itertools
 from pathlib import Path
 
 
@@ -21,20 +22,18 @@ def validate_season_map(season_map: dict[int, tuple[int, int]]) -> None:
             msg = f"Invalid episode range for season {season}: {start}-{end} (end cannot be less than start)"
             raise ValueError(msg)
 
-    # Check for overlapping episode ranges between seasons
-    all_episodes: dict[int, int] = {}  # episode_num -> season_num
-
-    for season, (start, end) in season_map.items():
-        for episode in range(start, end + 1):
-            if episode in all_episodes:
-                existing_season = all_episodes[episode]
-                msg = (
-                    f"Episode {episode} appears in multiple seasons: "
-                    f"season {existing_season} and season {season}. "
-                    f"Each episode can only belong to one season."
-                )
-                raise ValueError(msg)
-            all_episodes[episode] = season
+    # Check for overlapping episode ranges between seasons in one sweep. Once
+    # sorted by start, ranges only overlap if a range starts before the previous
+    # one ends.
+    ranges = sorted((start, end, season) for season, (start, end) in season_map.items())
+    for (_, prev_end, prev_season), (start, _, season) in itertools.pairwise(ranges):
+        if start <= prev_end:
+            msg = (
+                f"Episode {start} appears in multiple seasons: "
+                f"season {prev_season} and season {season}. "
+                f"Each episode can only belong to one season."
+            )
+            raise ValueError(msg)
 
 
 def _parse_episode_range(
@@ -47,13 +46,13 @@ def _parse_episode_range(
         msg = f"Line {line_number}: Empty episode range for season {season}"
         raise ValueError(msg)
 
-    if "-" in range_part:
-        parts = range_part.split("-", 1)
-        expected_parts = 2
-        if len(parts) != expected_parts or not parts[0].strip() or not parts[1].strip():
+    start_part, dash, end_part = range_part.partition("-")
+    if dash:
+        start_part, end_part = start_part.strip(), end_part.strip()
+        if not start_part or not end_part:
             msg = f"Line {line_number}: Invalid episode range format: {range_part}"
             raise ValueError(msg)
-        return int(parts[0].strip()), int(parts[1].strip())
+        return int(start_part), int(end_part)
 
     # Single episode
     episode = int(range_part)
@@ -62,15 +61,13 @@ def _parse_episode_range(
 
 def _parse_spec_line(line: str, line_number: int) -> tuple[int, tuple[int, int]]:
     """Parse a single line from the spec file."""
-    if "|" not in line:
+    season_part, sep, range_part = line.partition("|")
+    if not sep:
         msg = f"Line {line_number}: Invalid format. Expected 'season | episode_range' but got: {line}"
         raise ValueError(msg)
 
-    season_part, range_part = line.split("|", 1)
-    season = int(season_part.strip())
-    range_part = range_part.strip()
-
-    start, end = _parse_episode_range(range_part, season, line_number)
+    season = int(season_part)
+    start, end = _parse_episode_range(range_part.strip(), season, line_number)
     return season, (start, end)
 
 
@@ -87,13 +84,11 @@ def parse_spec_file(spec_path: Path) -> dict[int, tuple[int, int]]:
 
     """
     season_map = {}
-    line_number = 0
     duplicate_seasons = []
 
     try:
-        with spec_path.open() as f:
-            for line_content in f:
-                line_number += 1
+        with spec_path.open(encoding="utf-8") as f:
+            for line_number, line_content in enumerate(f, 1):
                 line = line_content.strip()
                 # Skip comments and empty lines
                 if not line or line.startswith("#"):
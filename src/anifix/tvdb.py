@@ -1,27 +1,64 @@
 """TVDB scraping functionality for generating spec files."""
 
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import os
 import re
 import sys
+import time
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-try:
+from anifix.errors import AnifixError
+
+if TYPE_CHECKING:
     import requests
     from bs4 import BeautifulSoup
+    from selectolax.lexbor import LexborHTMLParser
+
+# Only check that the scraping dependencies are installed here, they're imported
+# when a page is actually scraped so non-TVDB runs don't pay for loading them
+SELECTOLAX_AVAILABLE = importlib.util.find_spec("selectolax") is not None
+SCRAPING_AVAILABLE = importlib.util.find_spec("requests") is not None and (
+    SELECTOLAX_AVAILABLE or importlib.util.find_spec("bs4") is not None
+)
+
+# Without selectolax, BeautifulSoup is used with the C-backed lxml parser if it's
+# installed, falling back to the pure-Python one
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+_TVDB_URL_RE = re.compile(r"thetvdb\.com/(?:deriving/series/(\d+)|series/([^/?#]+))")
 
-    SCRAPING_AVAILABLE = True
-except ImportError:
-    SCRAPING_AVAILABLE = False
+# Fetched series pages are kept on disk for a day, so repeated runs skip the network.
+# The cache lives in the user's own cache directory, as its contents drive renames
+TVDB_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "anifix"
+)
+TVDB_CACHE_TTL = 24 * 60 * 60
+
+# The seasons table is the one with either of these classes. Both the bs4 filter
+# and the selectolax selector are built from them once
+_SEASONS_TABLE_CLASSES = ("table", "table-bordered")
+_SEASONS_TABLE_SELECTOR = ", ".join(f"table.{name}" for name in _SEASONS_TABLE_CLASSES)
+
+# Season rows have the label, first aired, last aired and episode count cells
+_MINIMUM_CELLS = 4
 
 
 def check_scraping_dependencies() -> None:
     """Check if scraping dependencies are available and provide helpful error message."""
     if not SCRAPING_AVAILABLE:
-        print("Error: Scraping feature requires additional dependencies.")
-        print("Install them with:")
-        print("  uv sync --group scraping")
-        print("Or if using pip:")
-        print("  pip install beautifulsoup4 requests")
-        sys.exit(1)
+        msg = (
+            "Scraping feature requires additional dependencies.\n"
+            "Install them with:\n"
+            "  uv sync --group scraping\n"
+            "Or if using pip:\n"
+            "  pip install beautifulsoup4 lxml requests"
+        )
+        raise AnifixError(msg)
 
 
 def extract_series_id_from_url(url: str) -> str:
@@ -30,48 +67,72 @@ def extract_series_id_from_url(url: str) -> str:
     # https://www.thetvdb.com/series/the-sandman
     # https://thetvdb.com/series/the-sandman/
     # https://www.thetvdb.com/series/the-sandman/seasons/official/1
-
-    patterns = [
-        r"thetvdb\.com/series/([^/]+)",
-        r"thetvdb\.com/deriving/series/(\d+)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    # https://thetvdb.com/deriving/series/12345
+    # https://www.thetvdb.com/series/the-sandman?tab=seasons
+    match = _TVDB_URL_RE.search(url)
+    if match:
+        return match.group(1) or match.group(2)
 
     msg = f"Could not extract series ID from URL: {url}"
     raise ValueError(msg)
 
 
-def scrape_tvdb_seasons(series_url: str) -> list[tuple[int, int]]:
+@functools.cache
+def _get_session() -> "requests.Session":
+    """Create the shared HTTP session, so repeated fetches reuse the connection."""
+    import requests  # noqa: PLC0415
+
+    session = requests.Session()
+    session.headers.update(
+        {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        },
+    )
+    return session
+
+
+@functools.lru_cache(maxsize=8)
+def scrape_tvdb_seasons(series_url: str) -> tuple[tuple[int, int], ...]:
     """
     Scrape TVDB series page to extract season and episode count information.
 
+    Results are cached per URL for the lifetime of the process, and the fetched
+    page is cached on disk (see TVDB_CACHE_DIR) for TVDB_CACHE_TTL seconds.
+
     Args:
         series_url: TVDB series URL
 
     Returns:
-        List of tuples (season_number, episode_count) for regular seasons
+        Tuple of (season_number, episode_count) pairs for regular seasons
 
     """
     check_scraping_dependencies()
 
+    import requests  # noqa: PLC0415
+
     try:
         # Ensure we're getting the main series page (not a specific season)
         series_id = extract_series_id_from_url(series_url)
         main_url = f"https://www.thetvdb.com/series/{series_id}"
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        }
-
-        response = requests.get(main_url, headers=headers, timeout=10)
+        cache_key = hashlib.blake2b(main_url.encode(), digest_size=16).hexdigest()
+        cache_file = TVDB_CACHE_DIR / cache_key
+        cached_page = _read_cached_page(cache_file)
+        if cached_page is not None:
+            try:
+                return tuple(_parse_seasons_html(cached_page))
+            except ValueError:
+                # Drop a cached page that doesn't parse and fetch it again
+                with contextlib.suppress(OSError):
+                    cache_file.unlink()
+
+        response = _get_session().get(main_url, timeout=10)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, "html.parser")
-        return _parse_seasons_table(soup)
+        seasons = tuple(_parse_seasons_html(response.content))
+        # Only cache pages that parsed, so a bad response is fetched again next time
+        _write_cached_page(cache_file, response.content)
+        return seasons
 
     except requests.RequestException as e:
         msg = f"Failed to fetch TVDB page: {e}"
@@ -81,65 +142,135 @@ def scrape_tvdb_seasons(series_url: str) -> list[tuple[int, int]]:
         raise ValueError(msg) from e
 
 
-def _parse_seasons_table(soup) -> list[tuple[int, int]]:  # type: ignore[misc]
+def _read_cached_page(cache_file: Path) -> bytes | None:
+    """Return a cached TVDB page if it's younger than TVDB_CACHE_TTL, else None."""
+    try:
+        if time.time() - cache_file.stat().st_mtime < TVDB_CACHE_TTL:
+            return cache_file.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+def _write_cached_page(cache_file: Path, content: bytes) -> None:
+    """Cache a fetched TVDB page, the cache is best effort so errors are ignored."""
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        temp_file.write_bytes(content)
+        # Replace in one step so other runs never read a half-written page
+        os.replace(temp_file, cache_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            temp_file.unlink(missing_ok=True)
+
+
+def _parse_seasons_html(html: bytes) -> list[tuple[int, int]]:
+    """Parse the seasons table from a TVDB page, with selectolax when it's installed."""
+    if SELECTOLAX_AVAILABLE:
+        from selectolax.lexbor import LexborHTMLParser  # noqa: PLC0415
+
+        return _parse_seasons_tree(LexborHTMLParser(html))
+
+    from bs4 import BeautifulSoup  # noqa: PLC0415
+
+    return _parse_seasons_table(BeautifulSoup(html, HTML_PARSER))
+
+
+def _parse_seasons_tree(tree: "LexborHTMLParser") -> list[tuple[int, int]]:
+    """Parse the seasons table from a selectolax tree."""
+    return _seasons_from_table(
+        tree.css_first(_SEASONS_TABLE_SELECTOR),
+        find_first=lambda node, tag: node.css_first(tag),
+        find_all=lambda node, tag: node.css(tag),
+        text=lambda node: node.text(strip=True),
+    )
+
+
+def _parse_seasons_table(soup: "BeautifulSoup") -> list[tuple[int, int]]:
     """Parse the seasons table from TVDB page soup."""
-    # Find the seasons table
-    table = soup.find("table", class_=["table", "table-bordered"])
-    if not table:
+    return _seasons_from_table(
+        soup.find("table", class_=_SEASONS_TABLE_CLASSES),
+        find_first=lambda node, tag: node.find(tag),
+        find_all=lambda node, tag: node.find_all(tag),
+        text=lambda node: node.get_text(strip=True),
+    )
+
+
+def _seasons_from_table[Node](
+    table: Node | None,
+    *,
+    find_first: Callable[[Node, str], Node | None],
+    find_all: Callable[[Node, str], Sequence[Node]],
+    text: Callable[[Node], str],
+) -> list[tuple[int, int]]:
+    """
+    Walk the rows of a seasons table, with the parser's node accessors passed in.
+
+    Returns:
+        List of (season_number, episode_count) pairs sorted by season number
+
+    Raises:
+        ValueError: If there is no table, or it has no valid seasons
+
+    """
+    if table is None:
         msg = "Could not find seasons table on TVDB page"
         raise ValueError(msg)
 
     seasons_data: list[tuple[int, int]] = []
-    tbody = table.find("tbody")
-    if not tbody:
+    tbody = find_first(table, "tbody")
+    if tbody is None:
         return seasons_data
 
-    rows = tbody.find_all("tr")
-    minimum_cells = 4
+    for row in find_all(tbody, "tr"):
+        # Check the season label in the first cell before looking at the other cells
+        first_cell = find_first(row, "td")
+        season_link = find_first(first_cell, "a") if first_cell is not None else None
+        if season_link is None:
+            continue
+
+        season_num = _season_number_from_label(text(season_link))
+        if season_num is None:
+            continue
 
-    for row in rows:
-        cells = row.find_all("td")
-        if len(cells) < minimum_cells:
+        cells = find_all(row, "td")
+        if len(cells) < _MINIMUM_CELLS:
             continue
 
-        season_data = _extract_season_from_row(cells)
+        season_data = _season_with_episode_count(season_num, text(cells[3]))
         if season_data:
             seasons_data.append(season_data)
 
+    # Check that some seasons were found and sort them by season number
     if not seasons_data:
         msg = "No valid seasons found on TVDB page"
         raise ValueError(msg)
 
-    # Sort by season number
     seasons_data.sort(key=lambda x: x[0])
     return seasons_data
 
 
-def _extract_season_from_row(cells) -> tuple[int, int] | None:  # type: ignore[misc]
-    """Extract season number and episode count from table row cells."""
-    # Get season info from the first cell
-    season_cell = cells[0]
-    season_link = season_cell.find("a")
-
-    if not season_link:
-        return None
-
-    season_text = season_link.get_text(strip=True)
-
+def _season_number_from_label(season_text: str) -> int | None:
+    """Get the number from a 'Season N' label, or None for other rows."""
     # Skip non-season rows (All Seasons, Specials, Unassigned)
     if not season_text.startswith("Season "):
         return None
 
-    # Extract season number
-    season_match = re.search(r"Season (\d+)", season_text)
-    if not season_match:
+    number_text, _, _ = season_text[7:].partition(" ")
+    if not number_text.isdecimal():
         return None
 
-    season_num = int(season_match.group(1))
+    return int(number_text)
+
 
-    # Get episode count from the fourth cell
-    episode_count_text = cells[3].get_text(strip=True)
-    if not episode_count_text.isdigit():
+def _season_with_episode_count(
+    season_num: int,
+    episode_count_text: str,
+) -> tuple[int, int] | None:
+    """Pair a season number with its episode count, or None if it has no episodes."""
+    # isdecimal() only accepts what int() can parse, unlike isdigit() (e.g. "²")
+    if not episode_count_text.isdecimal():
         return None
 
     episode_count = int(episode_count_text)
@@ -165,20 +296,21 @@ def generate_spec_from_tvdb(series_url: str, output_path: Path | None = None) ->
     """
     seasons_data = scrape_tvdb_seasons(series_url)
 
-    # Generate spec content
-    lines = ["# Season | Episode range"]
-
-    current_episode = 1
-    for season_num, episode_count in seasons_data:
-        end_episode = current_episode + episode_count - 1
-        lines.append(f"{season_num} | {current_episode}-{end_episode}")
-        current_episode = end_episode + 1
-
-    spec_content = "\n".join(lines) + "\n"
+    # Generate spec content, the trailing empty line ends the file with a newline
+    lines = [
+        "# Season | Episode range",
+        *(
+            f"{season} | {start}-{end}"
+            for season, start, end in _season_ranges_from_counts(seasons_data)
+        ),
+        "",
+    ]
+    spec_content = "\n".join(lines)
 
     # Write to file if path provided
     if output_path:
-        output_path.write_text(spec_content)
+        # Write the UTF-8 bytes directly, parse_spec_file reads them back as UTF-8
+        output_path.write_bytes(spec_content.encode("utf-8"))
         print(f"Generated spec file: {output_path}")
 
     return spec_content
@@ -196,16 +328,27 @@ def generate_season_map_from_tvdb(series_url: str) -> dict[int, tuple[int, int]]
 
     """
     seasons_data = scrape_tvdb_seasons(series_url)
-    season_map: dict[int, tuple[int, int]] = {}
+    return {
+        season: (start, end)
+        for season, start, end in _season_ranges_from_counts(seasons_data)
+    }
 
+
+def _season_ranges_from_counts(
+    seasons_data: tuple[tuple[int, int], ...],
+) -> Iterator[tuple[int, int, int]]:
+    """
+    Lay out (season, episode_count) pairs as consecutive episode ranges.
+
+    Ranges are yielded as (season, start_episode, end_episode) triples, so a season
+    number TVDB lists twice keeps both of its ranges.
+    """
     current_episode = 1
     for season_num, episode_count in seasons_data:
         end_episode = current_episode + episode_count - 1
-        season_map[season_num] = (current_episode, end_episode)
+        yield season_num, current_episode, end_episode
         current_episode = end_episode + 1
 
-    return season_map
-
 
 def print_tvdb_info(series_url: str) -> None:
     """Print information about TVDB series without generating a file."""
@@ -216,14 +359,11 @@ def print_tvdb_info(series_url: str) -> None:
         print(f"TVDB Series: {series_id}")
         print(f"Found {len(seasons_data)} season(s):")
 
-        current_episode = 1
-        for season_num, episode_count in seasons_data:
-            end_episode = current_episode + episode_count - 1
+        for season_num, start, end in _season_ranges_from_counts(seasons_data):
             print(
-                f"  Season {season_num}: {episode_count} episodes (would map to episodes {current_episode}-{end_episode})",
+                f"  Season {season_num}: {end - start + 1} episodes (would map to episodes {start}-{end})",
             )
-            current_episode = end_episode + 1
 
-    except ValueError as e:
+    except (AnifixError, ValueError) as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -1,12 +1,120 @@
 """Shared fixtures and utilities for anifix tests."""
 
+import argparse
 import json
+import os
 import tempfile
+from collections.abc import Callable, Generator
 from pathlib import Path
-from typing import Generator
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
 import pytest
 
+from anifix.tvdb import scrape_tvdb_seasons
+
+if TYPE_CHECKING:
+    from pyfakefs.fake_filesystem import FakeFilesystem
+
+CORE_MOCK_NAMES = (
+    "validate_directory",
+    "find_spec_file",
+    "parse_spec_file",
+    "rename_episode_files",
+    "restore_files",
+    "handle_url_spec",
+    "print_verbose_info",
+)
+
+SAMPLE_SPEC_CONTENT = """# Season | Episode range
+1 | 1-4
+2 | 5-7
+3 | 8-10"""
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --runslow option."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: list[pytest.Item],
+) -> None:
+    """Skip tests marked as slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="needs --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def arg_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once, tests only call parse_args on it."""
+    from anifix.core import create_argument_parser
+
+    return create_argument_parser()
+
+
+@pytest.fixture(scope="session")
+def anifix_spec() -> Callable[[Path], dict[int, tuple[int, int]]]:
+    """Import parse_spec_file only when a test asks for it."""
+    from anifix.spec import parse_spec_file
+
+    return parse_spec_file
+
+
+@pytest.fixture(autouse=True)
+def clear_tvdb_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Generator[None, None, None]:
+    """
+    Drop cached TVDB results around every test and keep the disk cache in tmp_path.
+
+    scrape_tvdb_seasons caches per process, so a result left behind by one test
+    would skip the dependency check and network mocks of the next.
+    """
+    scrape_tvdb_seasons.cache_clear()
+    monkeypatch.setattr("anifix.tvdb.TVDB_CACHE_DIR", tmp_path / "tvdb-cache")
+    yield
+    scrape_tvdb_seasons.cache_clear()
+
+
+@pytest.fixture
+def core_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """
+    Replace the helpers used by anifix.core.main with mocks.
+
+    The spec helpers return a /tmp/anifix.spec path and a single 1-10 season.
+    """
+    mocks = {name: Mock() for name in CORE_MOCK_NAMES}
+    mocks["find_spec_file"].return_value = Path("/tmp/anifix.spec")
+    mocks["parse_spec_file"].return_value = {1: (1, 10)}
+    for name, mock in mocks.items():
+        monkeypatch.setattr(f"anifix.core.{name}", mock)
+    return SimpleNamespace(**mocks)
+
+
+@pytest.fixture
+def run_main(monkeypatch: pytest.MonkeyPatch) -> Callable[[list[str]], None]:
+    """Return a helper that runs anifix.core.main with the given arguments."""
+    from anifix.core import main
+
+    def _run(args: list[str]) -> None:
+        monkeypatch.setattr("sys.argv", ["anifix", *args])
+        main()
+
+    return _run
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
@@ -18,10 +126,7 @@ def temp_dir() -> Generator[Path, None, None]:
 @pytest.fixture
 def sample_spec_content() -> str:
     """Sample spec file content for testing."""
-    return """# Season | Episode range
-1 | 1-4
-2 | 5-7
-3 | 8-10"""
+    return SAMPLE_SPEC_CONTENT
 
 
 @pytest.fixture
@@ -32,35 +137,77 @@ def sample_spec_file(temp_dir: Path, sample_spec_content: str) -> Path:
     return spec_file
 
 
-@pytest.fixture
-def sample_episode_files(temp_dir: Path) -> list[Path]:
-    """Create sample episode files for testing."""
+@pytest.fixture(scope="module")
+def sample_spec_file_ro(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample spec file shared by tests that only read it."""
+    spec_file = tmp_path_factory.mktemp("spec") / "anifix.spec"
+    spec_file.write_text(SAMPLE_SPEC_CONTENT)
+    return spec_file
+
+
+@pytest.fixture(scope="module")
+def spec_1_10(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a single-season '1 | 1-10' spec file once per module."""
+    spec_file = tmp_path_factory.mktemp("spec") / "anifix.spec"
+    spec_file.write_text("1 | 1-10")
+    return spec_file
+
+
+SAMPLE_EPISODE_TITLES = [
+    "My First Episode",
+    "My Second Episode",
+    "My Third Episode",
+    "My Fourth Episode",
+    "My Fifth Episode",
+    "My Sixth Episode",
+    "My Seventh Episode",
+    "My Eighth Episode",
+    "My Ninth Episode",
+    "My Tenth Episode",
+]
+
+
+def create_episode_files(directory: Path) -> list[Path]:
+    """Create the sample 'Episode N - Title.mkv' files in a directory."""
     files = []
-    episode_titles = [
-        "My First Episode",
-        "My Second Episode",
-        "My Third Episode",
-        "My Fourth Episode",
-        "My Fifth Episode",
-        "My Sixth Episode",
-        "My Seventh Episode",
-        "My Eighth Episode",
-        "My Ninth Episode",
-        "My Tenth Episode",
-    ]
-
-    for i, title in enumerate(episode_titles, 1):
-        filename = f"Episode {i} - {title}.mkv"
-        file_path = temp_dir / filename
-        file_path.write_text("dummy video content")
+    for i, title in enumerate(SAMPLE_EPISODE_TITLES, 1):
+        file_path = directory / f"Episode {i} - {title}.mkv"
+        file_path.touch()  # Only existence matters, not content
         files.append(file_path)
+    return files
+
+
+@pytest.fixture(scope="session")
+def _episode_template(tmp_path_factory: pytest.TempPathFactory) -> list[Path]:
+    """Create the sample episode files once, for sample_episode_files to link."""
+    return create_episode_files(tmp_path_factory.mktemp("episodes"))
+
 
+@pytest.fixture
+def sample_episode_files(temp_dir: Path, _episode_template: list[Path]) -> list[Path]:
+    """Create sample episode files for testing, hardlinked from the template."""
+    files = []
+    for template in _episode_template:
+        file_path = temp_dir / template.name
+        try:
+            os.link(template, file_path)
+        except OSError:  # Different filesystem, or no hardlink support
+            file_path.touch()
+        files.append(file_path)
     return files
 
 
 @pytest.fixture
+def fake_episode_files(fs: "FakeFilesystem") -> list[Path]:
+    """Create sample episode files in an in-memory filesystem."""
+    directory = Path("/anime")
+    directory.mkdir()
+    return create_episode_files(directory)
+
+
+@pytest.fixture(scope="module")
 def sample_backup_data() -> dict[str, str]:
-    """Sample backup data for testing restore functionality."""
+    """Sample backup data for testing restore functionality (don't mutate it)."""
     return {
         "S01E01 - My First Episode.mkv": "Episode 1 - My First Episode.mkv",
         "S01E02 - My Second Episode.mkv": "Episode 2 - My Second Episode.mkv",
@@ -77,6 +224,18 @@ def backup_file(temp_dir: Path, sample_backup_data: dict[str, str]) -> Path:
     return backup_file
 
 
+@pytest.fixture(scope="module")
+def backup_file_ro(
+    tmp_path_factory: pytest.TempPathFactory,
+    sample_backup_data: dict[str, str],
+) -> Path:
+    """Create a backup file shared by tests that only read it."""
+    backup_file = tmp_path_factory.mktemp("backup") / ".anifix-backup.json"
+    with backup_file.open("w") as f:
+        json.dump(sample_backup_data, f, indent=2)
+    return backup_file
+
+
 def create_renamed_files(temp_dir: Path, backup_data: dict[str, str]) -> list[Path]:
     """Create renamed files based on backup data."""
     files = []
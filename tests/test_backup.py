@@ -0,0 +1,156 @@
+"""Tests for anifix backup and restore."""
+
+from pathlib import Path
+
+import pytest
+
+from anifix.backup import (
+    load_backup_file,
+    open_backup_journal,
+    restore_files,
+    save_backup_file,
+    write_backup_entry,
+)
+
+# Compact JSON written by save_backup_file for {"new_name.mkv": "old_name.mkv"}
+SAVED_BACKUP_BYTES = b'{"new_name.mkv":"old_name.mkv"}'
+
+
+class TestBackupFunctions:
+    """Tests for backup file functions."""
+
+    def test_load_backup_file_exists(
+        self, backup_file_ro: Path, sample_backup_data: dict[str, str]
+    ) -> None:
+        """Test loading an existing backup file."""
+        result = load_backup_file(backup_file_ro.parent)
+        assert result == sample_backup_data
+
+    def test_load_backup_file_not_exists(self, temp_dir: Path) -> None:
+        """Test loading backup file when it doesn't exist."""
+        result = load_backup_file(temp_dir)
+        assert result == {}
+
+    def test_load_backup_file_invalid_json(self, temp_dir: Path) -> None:
+        """Test loading backup file with invalid JSON."""
+        backup_file = temp_dir / ".anifix-backup.json"
+        backup_file.write_text("invalid json content")
+
+        result = load_backup_file(temp_dir)
+        assert result == {}
+
+    def test_load_backup_file_empty(
+        self, temp_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that an empty backup file loads as no backup, without a warning."""
+        (temp_dir / ".anifix-backup.json").write_bytes(b"  \n")
+
+        assert load_backup_file(temp_dir) == {}
+        assert "Warning" not in capsys.readouterr().out
+
+    def test_load_backup_file_not_an_object(
+        self, temp_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a backup file holding something other than an object is skipped."""
+        (temp_dir / ".anifix-backup.json").write_bytes(b'["a.mkv"]')
+
+        assert load_backup_file(temp_dir) == {}
+        assert "Could not read backup file" in capsys.readouterr().out
+
+    def test_save_backup_file(self, temp_dir: Path) -> None:
+        """Test saving backup file."""
+        backup_data = {"new_name.mkv": "old_name.mkv"}
+        save_backup_file(temp_dir, backup_data)
+
+        backup_file = temp_dir / ".anifix-backup.json"
+        assert backup_file.exists()
+
+        assert backup_file.read_bytes() == SAVED_BACKUP_BYTES
+
+    def test_load_backup_file_replays_journal(
+        self, backup_file: Path, sample_backup_data: dict[str, str]
+    ) -> None:
+        """Test that renames left in the journal are applied on load."""
+        temp_dir = backup_file.parent
+        journal = open_backup_journal(temp_dir)
+        assert journal is not None
+        with journal:
+            write_backup_entry(
+                journal,
+                "S01E01 - My First Episode.mkv",
+                "S02E01 - My First Episode.mkv",
+                "Episode 1 - My First Episode.mkv",
+            )
+            write_backup_entry(
+                journal,
+                "Episode 3 - My Third Episode.mkv",
+                "S01E03 - My Third Episode.mkv",
+                "Episode 3 - My Third Episode.mkv",
+            )
+
+        result = load_backup_file(temp_dir)
+
+        expected = dict(sample_backup_data)
+        del expected["S01E01 - My First Episode.mkv"]
+        expected["S02E01 - My First Episode.mkv"] = "Episode 1 - My First Episode.mkv"
+        expected["S01E03 - My Third Episode.mkv"] = "Episode 3 - My Third Episode.mkv"
+        assert result == expected
+
+    def test_load_backup_file_ignores_torn_journal_line(self, temp_dir: Path) -> None:
+        """Test that a partially written journal line is ignored."""
+        journal = open_backup_journal(temp_dir)
+        assert journal is not None
+        with journal:
+            write_backup_entry(journal, "a.mkv", "b.mkv", "a.mkv")
+            journal.write(b'{"old":"c.mkv","ne')
+
+        assert load_backup_file(temp_dir) == {"b.mkv": "a.mkv"}
+
+    def test_save_backup_file_removes_journal(self, temp_dir: Path) -> None:
+        """Test that saving the backup file clears the journal."""
+        journal = open_backup_journal(temp_dir)
+        assert journal is not None
+        with journal:
+            write_backup_entry(journal, "old_name.mkv", "new_name.mkv", "old_name.mkv")
+        save_backup_file(temp_dir, load_backup_file(temp_dir))
+
+        assert not (temp_dir / ".anifix-backup.jsonl").exists()
+        assert load_backup_file(temp_dir) == {"new_name.mkv": "old_name.mkv"}
+
+
+class TestRestoreFiles:
+    """Tests for restore_files function."""
+
+    def test_restore_files_success(
+        self, backup_file: Path, sample_backup_data: dict[str, str]
+    ) -> None:
+        """Test successful file restoration."""
+        temp_dir = backup_file.parent
+
+        # Create renamed files
+        for current_name in sample_backup_data:
+            file_path = temp_dir / current_name
+            file_path.write_text("content")
+
+        # Test restoration
+        restore_files(temp_dir)
+
+        # Check that original files exist
+        for original_name in sample_backup_data.values():
+            assert (temp_dir / original_name).exists()
+
+        # Check that backup file is removed
+        assert not backup_file.exists()
+
+    def test_restore_files_no_backup(self, temp_dir: Path) -> None:
+        """Test restoration when no backup file exists."""
+        restore_files(temp_dir)  # Should not raise an error
+
+    def test_restore_files_missing_current_file(
+        self, backup_file: Path, sample_backup_data: dict[str, str]
+    ) -> None:
+        """Test restoration when current file is missing."""
+        temp_dir = backup_file.parent
+
+        # Don't create the renamed files
+        restore_files(temp_dir)
@@ -1,220 +1,188 @@
 """Tests for anifix CLI functionality."""
 
+import argparse
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 import pytest
 
-from anifix.core import create_argument_parser, main
+import anifix.tvdb
+from anifix.core import handle_url_spec
 
+TVDB_TEST_URL = "https://www.thetvdb.com/series/test-series"
 
-class TestArgumentParser:
-    """Tests for the argument parser."""
-
-    def test_create_argument_parser(self) -> None:
-        """Test that argument parser is created correctly."""
-        parser = create_argument_parser()
-
-        # Test that parser has expected arguments
-        args = parser.parse_args([])
-
-        # Check default values
-        assert args.directory == Path.cwd()
-        assert args.spec_file is None
-        assert args.dry_run is False
-        assert args.verbose is False
-        assert args.restore is False
-
-    def test_argument_parser_with_all_args(self) -> None:
-        """Test argument parser with all arguments provided."""
-        parser = create_argument_parser()
-
-        test_args = [
-            "-d",
-            "/tmp/test",
-            "-s",
-            "/tmp/test.spec",
-            "--dry-run",
-            "--verbose",
-            "--restore",
-        ]
 
-        args = parser.parse_args(test_args)
+def capture_calls(
+    monkeypatch: pytest.MonkeyPatch, target: str
+) -> list[tuple[tuple[object, ...], dict[str, object]]]:
+    """Replace target with a function that records the (args, kwargs) of each call."""
+    calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
 
-        assert args.directory == Path("/tmp/test")
-        assert args.spec_file == Path("/tmp/test.spec")
-        assert args.dry_run is True
-        assert args.verbose is True
-        assert args.restore is True
+    def _capture(*args: object, **kwargs: object) -> None:
+        calls.append((args, kwargs))
 
-    def test_argument_parser_short_flags(self) -> None:
-        """Test argument parser with short flags."""
-        parser = create_argument_parser()
+    monkeypatch.setattr(target, _capture)
+    return calls
 
-        test_args = ["-d", "/tmp", "-s", "test.spec", "-v"]
-        args = parser.parse_args(test_args)
 
-        assert args.directory == Path("/tmp")
-        assert args.spec_file == Path("test.spec")
-        assert args.verbose is True
-
-    def test_argument_parser_url_spec(self) -> None:
-        """Test argument parser with --url-spec argument."""
-        parser = create_argument_parser()
-
-        test_args = ["--url-spec", "https://www.thetvdb.com/series/test-series"]
-        args = parser.parse_args(test_args)
-
-        assert args.url_spec == "https://www.thetvdb.com/series/test-series"
-
-    def test_argument_parser_with_url_spec_and_directory(self) -> None:
-        """Test argument parser with both --url-spec and directory."""
-        parser = create_argument_parser()
+class TestArgumentParser:
+    """Tests for the argument parser."""
 
-        test_args = [
-            "--url-spec",
-            "https://www.thetvdb.com/series/test-series",
-            "-d",
-            "/tmp/anime",
-            "--dry-run",
-        ]
-        args = parser.parse_args(test_args)
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            pytest.param(
+                [],
+                {
+                    "directory": Path.cwd(),
+                    "spec_file": None,
+                    "dry_run": False,
+                    "verbose": False,
+                    "restore": False,
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                [
+                    "-d",
+                    "/tmp/test",
+                    "-s",
+                    "/tmp/test.spec",
+                    "--dry-run",
+                    "--verbose",
+                    "--restore",
+                ],
+                {
+                    "directory": Path("/tmp/test"),
+                    "spec_file": Path("/tmp/test.spec"),
+                    "dry_run": True,
+                    "verbose": True,
+                    "restore": True,
+                },
+                id="all_args",
+            ),
+            pytest.param(
+                ["-d", "/tmp", "-s", "test.spec", "-v"],
+                {
+                    "directory": Path("/tmp"),
+                    "spec_file": Path("test.spec"),
+                    "verbose": True,
+                },
+                id="short_flags",
+            ),
+            pytest.param(
+                ["--url-spec", TVDB_TEST_URL],
+                {"url_spec": TVDB_TEST_URL},
+                id="url_spec",
+            ),
+            pytest.param(
+                ["--url-spec", TVDB_TEST_URL, "-d", "/tmp/anime", "--dry-run"],
+                {
+                    "url_spec": TVDB_TEST_URL,
+                    "directory": Path("/tmp/anime"),
+                    "dry_run": True,
+                },
+                id="url_spec_and_directory",
+            ),
+        ],
+    )
+    def test_parse_args(
+        self,
+        arg_parser: argparse.ArgumentParser,
+        argv: list[str],
+        expected: dict[str, object],
+    ) -> None:
+        """Test that parsed arguments have the expected values."""
+        args = arg_parser.parse_args(argv)
 
-        assert args.url_spec == "https://www.thetvdb.com/series/test-series"
-        assert args.directory == Path("/tmp/anime")
-        assert args.dry_run is True
+        for name, value in expected.items():
+            assert getattr(args, name) == value
 
 
 class TestMainFunction:
     """Tests for the main function."""
 
-    @patch("anifix.core.validate_directory")
-    @patch("anifix.core.restore_files")
-    def test_main_restore_mode(self, mock_restore: Mock, mock_validate: Mock) -> None:
+    def test_main_restore_mode(
+        self, core_mocks: SimpleNamespace, run_main: Callable[[list[str]], None]
+    ) -> None:
         """Test main function in restore mode."""
         test_args = ["--restore", "-d", "/tmp/test"]
+        run_main(test_args)
 
-        with patch("sys.argv", ["anifix"] + test_args):
-            main()
-
-        mock_validate.assert_called_once()
-        mock_restore.assert_called_once()
+        core_mocks.validate_directory.assert_called_once()
+        core_mocks.restore_files.assert_called_once()
 
-    @patch("anifix.core.validate_directory")
-    @patch("anifix.core.find_spec_file")
-    @patch("anifix.core.parse_spec_file")
-    @patch("anifix.core.rename_episode_files")
     def test_main_normal_mode(
-        self,
-        mock_rename: Mock,
-        mock_parse: Mock,
-        mock_find: Mock,
-        mock_validate: Mock,
+        self, core_mocks: SimpleNamespace, run_main: Callable[[list[str]], None]
     ) -> None:
         """Test main function in normal rename mode."""
-        # Setup mocks
-        mock_find.return_value = Path("/tmp/anifix.spec")
-        mock_parse.return_value = {1: (1, 10)}
-
         test_args = ["-d", "/tmp/test"]
+        run_main(test_args)
 
-        with patch("sys.argv", ["anifix"] + test_args):
-            main()
-
-        mock_validate.assert_called_once()
-        mock_find.assert_called_once()
-        mock_parse.assert_called_once()
-        mock_rename.assert_called_once()
+        core_mocks.validate_directory.assert_called_once()
+        core_mocks.find_spec_file.assert_called_once()
+        core_mocks.parse_spec_file.assert_called_once()
+        core_mocks.rename_episode_files.assert_called_once()
 
-    @patch("anifix.core.validate_directory")
-    @patch("anifix.core.find_spec_file")
-    @patch("anifix.core.parse_spec_file")
     def test_main_empty_season_map(
-        self,
-        mock_parse: Mock,
-        mock_find: Mock,
-        mock_validate: Mock,
+        self, core_mocks: SimpleNamespace, run_main: Callable[[list[str]], None]
     ) -> None:
-        """Test main function with empty season map."""
-        # Setup mocks
-        mock_find.return_value = Path("/tmp/anifix.spec")
-        mock_parse.return_value = {}
+        """Test main function exits before renaming with an empty season map."""
+        core_mocks.parse_spec_file.return_value = {}
+        core_mocks.rename_episode_files.side_effect = AssertionError("should not run")
 
         test_args = ["-d", "/tmp/test"]
+        with pytest.raises(SystemExit) as exc_info:
+            run_main(test_args)
 
-        with patch("sys.argv", ["anifix"] + test_args):
-            with pytest.raises(SystemExit):
-                main()
+        assert exc_info.value.code != 0
 
-    @patch("anifix.core.validate_directory")
-    @patch("anifix.core.find_spec_file")
-    @patch("anifix.core.parse_spec_file")
-    @patch("anifix.core.rename_episode_files")
     def test_main_dry_run_mode(
         self,
-        mock_rename: Mock,
-        mock_parse: Mock,
-        mock_find: Mock,
-        mock_validate: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+        core_mocks: SimpleNamespace,
+        run_main: Callable[[list[str]], None],
     ) -> None:
         """Test main function in dry run mode."""
-        # Setup mocks
-        mock_find.return_value = Path("/tmp/anifix.spec")
-        mock_parse.return_value = {1: (1, 10)}
+        rename_calls = capture_calls(monkeypatch, "anifix.core.rename_episode_files")
 
         test_args = ["--dry-run", "-d", "/tmp/test"]
-
-        with patch("sys.argv", ["anifix"] + test_args):
-            main()
+        run_main(test_args)
 
         # Check that rename was called with dry_run=True
-        mock_rename.assert_called_once()
-        call_args = mock_rename.call_args
-        assert call_args.kwargs["dry_run"] is True
-
-    @patch("anifix.core.validate_directory")
-    @patch("anifix.core.find_spec_file")
-    @patch("anifix.core.parse_spec_file")
-    @patch("anifix.core.print_verbose_info")
-    @patch("anifix.core.rename_episode_files")
+        assert len(rename_calls) == 1
+        _, kwargs = rename_calls[0]
+        assert kwargs["dry_run"] is True
+
     def test_main_verbose_mode(
         self,
-        mock_rename: Mock,
-        mock_verbose: Mock,
-        mock_parse: Mock,
-        mock_find: Mock,
-        mock_validate: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+        core_mocks: SimpleNamespace,
+        run_main: Callable[[list[str]], None],
     ) -> None:
         """Test main function in verbose mode."""
-        # Setup mocks
-        spec_file = Path("/tmp/anifix.spec")
-        season_map = {1: (1, 10)}
-        mock_find.return_value = spec_file
-        mock_parse.return_value = season_map
+        verbose_calls = capture_calls(monkeypatch, "anifix.core.print_verbose_info")
 
         test_args = ["--verbose", "-d", "/tmp/test"]
-
-        with patch("sys.argv", ["anifix"] + test_args):
-            main()
+        run_main(test_args)
 
         # Check that verbose info was printed
-        mock_verbose.assert_called_once()
-        call_args = mock_verbose.call_args[0]
-        assert call_args[1] == spec_file
-        assert call_args[2] == season_map
-
-    @patch("anifix.core.validate_directory")
-    @patch("anifix.core.handle_url_spec")
-    @patch("anifix.core.rename_episode_files")
+        assert len(verbose_calls) == 1
+        args, _ = verbose_calls[0]
+        assert args[1] == Path("/tmp/anifix.spec")
+        assert args[2] == {1: (1, 10)}
+
     def test_main_url_spec_mode(
         self,
-        mock_rename: Mock,
-        mock_handle_url_spec: Mock,
-        mock_validate: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+        core_mocks: SimpleNamespace,
+        run_main: Callable[[list[str]], None],
     ) -> None:
         """Test main function with --url-spec argument."""
         # Setup mocks
-        mock_handle_url_spec.return_value = {1: (1, 11), 2: (12, 23)}
+        core_mocks.handle_url_spec.return_value = {1: (1, 11), 2: (12, 23)}
+        rename_calls = capture_calls(monkeypatch, "anifix.core.rename_episode_files")
 
         test_args = [
             "--url-spec",
@@ -222,23 +190,29 @@ class TestMainFunction:
             "-d",
             "/tmp/test",
         ]
+        run_main(test_args)
 
-        with patch("sys.argv", ["anifix"] + test_args):
-            main()
-
-        mock_validate.assert_called_once()
-        mock_handle_url_spec.assert_called_once()
-        mock_rename.assert_called_once()
+        core_mocks.validate_directory.assert_called_once()
+        core_mocks.handle_url_spec.assert_called_once()
 
         # Check that rename was called with the correct season map
-        call_args = mock_rename.call_args
-        season_map = call_args[0][1]  # Second positional argument
-        assert season_map == {1: (1, 11), 2: (12, 23)}
+        assert len(rename_calls) == 1
+        args, _ = rename_calls[0]
+        assert args[1] == {1: (1, 11), 2: (12, 23)}  # Second positional argument
 
-    @patch("anifix.tvdb.SCRAPING_AVAILABLE", new=False)
-    def test_main_url_spec_missing_dependencies(self) -> None:
+    def test_main_url_spec_missing_dependencies(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        core_mocks: SimpleNamespace,
+        run_main: Callable[[list[str]], None],
+    ) -> None:
         """Test main function with --url-spec when dependencies are missing."""
-        test_args = ["--url-spec", "https://www.thetvdb.com/series/test-series"]
+        monkeypatch.setattr(anifix.tvdb, "SCRAPING_AVAILABLE", False)
+        # Keep the real TVDB path, everything that touches the filesystem is mocked
+        core_mocks.handle_url_spec.side_effect = handle_url_spec
+        test_args = ["--url-spec", TVDB_TEST_URL]
+
+        with pytest.raises(SystemExit):
+            run_main(test_args)
 
-        with patch("sys.argv", ["anifix", *test_args]), pytest.raises(SystemExit):
-            main()
+        core_mocks.rename_episode_files.assert_not_called()
@@ -0,0 +1,39 @@
+"""Tests for anifix spec file discovery."""
+
+from pathlib import Path
+
+import pytest
+
+from anifix.cli import find_spec_file
+from anifix.errors import AnifixError
+
+
+class TestFindSpecFile:
+    """Tests for find_spec_file function."""
+
+    def test_find_spec_file_with_argument(self, sample_spec_file_ro: Path) -> None:
+        """Test finding spec file when provided as argument."""
+        result = find_spec_file(sample_spec_file_ro.parent, sample_spec_file_ro)
+        assert result.resolve() == sample_spec_file_ro.resolve()
+
+    def test_find_spec_file_search_priority(self, temp_dir: Path) -> None:
+        """Test spec file search priority."""
+        # Create multiple spec files
+        for name in ("anifix", ".anifix", "anifix.spec"):
+            (temp_dir / name).write_bytes(b"1 | 1-5")
+
+        # Should find anifix.spec first (highest priority)
+        result = find_spec_file(temp_dir, None)
+        assert result == temp_dir / "anifix.spec"
+
+    def test_find_spec_file_not_found(self, temp_dir: Path) -> None:
+        """Test when no spec file is found."""
+        with pytest.raises(AnifixError, match="No spec file found"):
+            find_spec_file(temp_dir, None)
+
+    def test_find_spec_file_argument_not_exists(self, temp_dir: Path) -> None:
+        """Test when provided spec file doesn't exist."""
+        nonexistent = temp_dir / "nonexistent.spec"
+
+        with pytest.raises(AnifixError, match="not found"):
+            find_spec_file(temp_dir, nonexistent)
@@ -9,8 +9,9 @@ import pytest
 from anifix.backup import load_backup_file, save_backup_file
 from anifix.cli import validate_directory
 from anifix.episode import find_season_for_episode, get_episode_number_from_filename
+from anifix.errors import AnifixError
 from anifix.renamer import rename_episode_files
-from anifix.spec import parse_spec_file
+from anifix.spec import parse_spec_file, validate_season_map
 
 
 class TestEdgeCases:
@@ -159,7 +160,7 @@ class TestErrorHandling:
         """Test validation of nonexistent directory."""
         nonexistent = temp_dir / "nonexistent"
 
-        with pytest.raises(SystemExit):
+        with pytest.raises(AnifixError, match="does not exist"):
             validate_directory(nonexistent)
 
     def test_validate_directory_is_file(self, temp_dir: Path) -> None:
@@ -167,7 +168,7 @@ class TestErrorHandling:
         file_path = temp_dir / "not_a_directory.txt"
         file_path.write_text("content")
 
-        with pytest.raises(SystemExit):
+        with pytest.raises(AnifixError, match="is not a directory"):
             validate_directory(file_path)
 
     def test_parse_spec_file_with_duplicate_seasons(self, temp_dir: Path) -> None:
@@ -220,6 +221,11 @@ class TestErrorHandling:
         with pytest.raises(ValueError, match="Episode 5 appears in multiple seasons"):
             parse_spec_file(spec_file)
 
+    def test_negative_season_range_is_valid(self) -> None:
+        """Test that a range below zero isn't reported as overlapping."""
+        validate_season_map({1: (-5, -1)})
+        validate_season_map({1: (-5, -1), 2: (0, 3)})
+
     def test_invalid_episode_ranges(self, temp_dir: Path) -> None:
         """Test handling of invalid episode ranges (end < start)."""
         spec_content = "1 | 10-5"
@@ -0,0 +1,108 @@
+"""Tests for anifix episode filename parsing and season lookup."""
+
+import pytest
+
+from anifix.episode import (
+    SeasonIndex,
+    build_season_index,
+    find_season_for_episode,
+    get_episode_number_from_filename,
+    lookup_season_in_index,
+    parse_episode_filename,
+)
+
+
+class TestGetEpisodeNumberFromFilename:
+    """Tests for get_episode_number_from_filename function."""
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("Episode 5 - Great Episode Title.mkv", 5),  # Standard format
+            ("episode 12 - Another Title.mp4", 12),  # Case insensitive
+            ("7 - Simple Title.avi", 7),  # Fallback to leading number
+            ("EPISODE\t003 - Tabbed Title.mkv", 3),  # Any whitespace, padded
+        ],
+    )
+    def test_extract_episode_number(self, filename: str, expected: int) -> None:
+        """Test extracting episode number from supported formats."""
+        assert get_episode_number_from_filename(filename) == expected
+
+    def test_extract_episode_number_no_match(self) -> None:
+        """Test extraction when no episode number is found."""
+        filename = "No Episode Number Here.mkv"
+
+        with pytest.raises(ValueError, match="Could not extract episode number"):
+            get_episode_number_from_filename(filename)
+
+
+class TestParseEpisodeFilename:
+    """Tests for parse_episode_filename function."""
+
+    def test_parse_episode_filename_standard_format(self) -> None:
+        """Test parsing number and title from standard format."""
+        result = parse_episode_filename("episode 12 - Another Title.mp4")
+        assert result == (12, "Another Title.mp4")
+
+    def test_parse_episode_filename_fallback(self) -> None:
+        """Test parsing number and title from fallback format."""
+        result = parse_episode_filename("7 - Simple Title.avi")
+        assert result == (7, "Simple Title.avi")
+
+    def test_parse_episode_filename_no_match(self) -> None:
+        """Test parsing when no episode number is found."""
+        with pytest.raises(ValueError, match="Could not extract episode number"):
+            parse_episode_filename("No Episode Number Here.mkv")
+
+
+@pytest.fixture(scope="class")
+def season_map() -> dict[int, tuple[int, int]]:
+    """Season map shared by the season lookup tests."""
+    return {1: (1, 4), 2: (5, 7), 3: (8, 10)}
+
+
+class TestFindSeasonForEpisode:
+    """Tests for find_season_for_episode function."""
+
+    @pytest.mark.parametrize(
+        ("episode_num", "expected"),
+        [(1, (1, 1)), (4, (1, 4)), (5, (2, 1)), (7, (2, 3)), (8, (3, 1)), (10, (3, 3))],
+    )
+    def test_find_season_for_episode_valid(
+        self,
+        season_map: dict[int, tuple[int, int]],
+        episode_num: int,
+        expected: tuple[int, int],
+    ) -> None:
+        """Test finding season for valid episode numbers."""
+        assert find_season_for_episode(episode_num, season_map) == expected
+
+    def test_find_season_for_episode_invalid(self) -> None:
+        """Test finding season for invalid episode number."""
+        season_map = {1: (1, 4), 2: (5, 7)}
+
+        with pytest.raises(ValueError, match="Episode 15 not found in any season"):
+            find_season_for_episode(15, season_map)
+
+    def test_find_season_for_episode_first_match(self) -> None:
+        """Test that overlapping, unvalidated maps resolve to the first season."""
+        assert find_season_for_episode(4, {1: (1, 10), 2: (3, 5)}) == (1, 4)
+
+    def test_lookup_season_in_index_with_gaps(self) -> None:
+        """Test looking up episodes in a bisect index with gaps."""
+        index = build_season_index({3: (6, 7), 1: (1, 3)})
+        assert index == SeasonIndex(starts=(1, 6), ends=(3, 7), seasons=(1, 3))
+
+        assert lookup_season_in_index(2, index) == (1, 2)
+        assert lookup_season_in_index(7, index) == (3, 2)
+
+        for episode_num in (0, 4, 8):
+            with pytest.raises(ValueError, match="not found in any season"):
+                lookup_season_in_index(episode_num, index)
+
+    def test_lookup_season_in_empty_index(self) -> None:
+        """Test that an empty season map gives an index with no episodes."""
+        index = build_season_index({})
+
+        with pytest.raises(ValueError, match="Episode 1 not found in any season"):
+            lookup_season_in_index(1, index)
@@ -0,0 +1,91 @@
+"""End-to-end tests for the anifix rename and restore workflow."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from anifix.backup import restore_files
+from anifix.renamer import rename_episode_files
+
+if TYPE_CHECKING:
+    from pyfakefs.fake_filesystem import FakeFilesystem
+
+
+class TestIntegration:
+    """Integration tests for the full workflow."""
+
+    def test_full_rename_and_restore_workflow(
+        self,
+        fs: "FakeFilesystem",
+        fake_episode_files: list[Path],
+        spec_1_10: Path,
+        anifix_spec: Callable[[Path], dict[int, tuple[int, int]]],
+    ) -> None:
+        """Test complete rename and restore workflow."""
+        temp_dir = fake_episode_files[0].parent
+
+        # Map the shared spec file into the fake directory
+        spec_file = temp_dir / "anifix.spec"
+        fs.add_real_file(spec_1_10, target_path=spec_file)
+
+        season_map = anifix_spec(spec_file)
+
+        # Store original filenames
+        original_names = [f.name for f in fake_episode_files]
+
+        # Rename files
+        rename_episode_files(temp_dir, season_map)
+
+        # Check files were renamed
+        for original_name in original_names:
+            assert not (temp_dir / original_name).exists()
+
+        # Restore files
+        restore_files(temp_dir)
+
+        # Check files were restored
+        for original_name in original_names:
+            assert (temp_dir / original_name).exists()
+
+        # Check backup file was removed
+        backup_file = temp_dir / ".anifix-backup.json"
+        assert not backup_file.exists()
+
+    @pytest.mark.slow
+    def test_multiple_rename_cycles(
+        self,
+        fs: "FakeFilesystem",
+        fake_episode_files: list[Path],
+        spec_1_10: Path,
+        anifix_spec: Callable[[Path], dict[int, tuple[int, int]]],
+    ) -> None:
+        """Test multiple rename cycles maintain backup integrity."""
+        temp_dir = fake_episode_files[0].parent
+
+        # Map the shared spec file into the fake directory, writable in memory only
+        spec_file = temp_dir / "anifix.spec"
+        fs.add_real_file(spec_1_10, read_only=False, target_path=spec_file)
+
+        season_map = anifix_spec(spec_file)
+        original_names = [f.name for f in fake_episode_files]
+
+        # First rename
+        rename_episode_files(temp_dir, season_map)
+
+        # Modify spec file for different mapping
+        spec_content2 = """1 | 1-5
+2 | 6-10"""
+        spec_file.write_text(spec_content2)
+        season_map2 = anifix_spec(spec_file)
+
+        # Second rename
+        rename_episode_files(temp_dir, season_map2)
+
+        # Restore should still work
+        restore_files(temp_dir)
+
+        # Check all original files are restored
+        for original_name in original_names:
+            assert (temp_dir / original_name).exists()
@@ -0,0 +1,181 @@
+"""Tests for anifix episode file renaming."""
+
+from pathlib import Path
+from typing import BinaryIO
+
+import pytest
+
+from anifix.backup import open_backup_journal, restore_files
+from anifix.renamer import (
+    CONCURRENT_RENAME_THRESHOLD,
+    build_rename_plan,
+    rename_episode_files,
+)
+
+
+class TestRenameEpisodeFiles:
+    """Tests for rename_episode_files function."""
+
+    def test_rename_episode_files_success(
+        self, temp_dir: Path, sample_episode_files: list[Path]
+    ) -> None:
+        """Test successful episode file renaming."""
+        season_map = {1: (1, 4), 2: (5, 7), 3: (8, 10)}
+
+        rename_episode_files(temp_dir, season_map)
+
+        # Check that files were renamed correctly
+        expected_names = [
+            "S01E01 - My First Episode.mkv",
+            "S01E02 - My Second Episode.mkv",
+            "S01E03 - My Third Episode.mkv",
+            "S01E04 - My Fourth Episode.mkv",
+            "S02E01 - My Fifth Episode.mkv",
+            "S02E02 - My Sixth Episode.mkv",
+            "S02E03 - My Seventh Episode.mkv",
+            "S03E01 - My Eighth Episode.mkv",
+            "S03E02 - My Ninth Episode.mkv",
+            "S03E03 - My Tenth Episode.mkv",
+        ]
+
+        for name in expected_names:
+            assert (temp_dir / name).exists()
+
+        # Check that backup file was created and the journal cleaned up
+        backup_file = temp_dir / ".anifix-backup.json"
+        assert backup_file.exists()
+        assert not (temp_dir / ".anifix-backup.jsonl").exists()
+
+    def test_rename_episode_files_dry_run(
+        self, temp_dir: Path, sample_episode_files: list[Path]
+    ) -> None:
+        """Test dry run mode doesn't rename files."""
+        season_map = {1: (1, 4), 2: (5, 7), 3: (8, 10)}
+
+        rename_episode_files(temp_dir, season_map, dry_run=True)
+
+        # Check that original files still exist
+        for file_path in sample_episode_files:
+            assert file_path.exists()
+
+        # Check that backup file was not created
+        backup_file = temp_dir / ".anifix-backup.json"
+        assert not backup_file.exists()
+        assert not (temp_dir / ".anifix-backup.jsonl").exists()
+
+    def test_rename_episode_files_already_renamed(self, temp_dir: Path) -> None:
+        """Test renaming files that are already in the correct format."""
+        # Create already renamed file
+        renamed_file = temp_dir / "S01E01 - My Episode.mkv"
+        renamed_file.write_text("content")
+
+        season_map = {1: (1, 4)}
+
+        rename_episode_files(temp_dir, season_map)
+
+        # File should still exist and not be renamed again
+        assert renamed_file.exists()
+
+    def test_rename_episode_files_nothing_to_do_skips_backup(
+        self, temp_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a run with nothing to rename doesn't read the backup file."""
+        (temp_dir / "S01E01 - My Episode.mkv").write_text("content")
+        (temp_dir / ".anifix-backup.json").write_text("invalid json content")
+
+        rename_episode_files(temp_dir, {1: (1, 4)})
+
+        assert "Could not read backup file" not in capsys.readouterr().out
+
+    def test_rename_episode_files_opens_journal_once(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        temp_dir: Path,
+        sample_episode_files: list[Path],
+    ) -> None:
+        """Test that one journal handle is shared by every rename in a run."""
+        opened: list[BinaryIO | None] = []
+
+        def _open(directory: Path) -> BinaryIO | None:
+            opened.append(open_backup_journal(directory))
+            return opened[-1]
+
+        monkeypatch.setattr("anifix.renamer.open_backup_journal", _open)
+
+        rename_episode_files(temp_dir, {1: (1, 10)})
+
+        assert len(opened) == 1
+        assert opened[0] is not None
+        assert opened[0].closed
+
+    def test_rename_episode_files_concurrently(
+        self, temp_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a large plan renames on the pool and restores cleanly."""
+        count = CONCURRENT_RENAME_THRESHOLD + 8
+        for i in range(1, count + 1):
+            (temp_dir / f"Episode {i} - Title.mkv").touch()
+
+        plan, _ = build_rename_plan(temp_dir, {1: (1, count)})
+
+        rename_episode_files(temp_dir, {1: (1, count)})
+
+        for i in range(1, count + 1):
+            assert (temp_dir / f"S01E{i:02d} - Title.mkv").exists()
+        assert not (temp_dir / ".anifix-backup.jsonl").exists()
+
+        # Results are still reported in plan order
+        assert capsys.readouterr().out.splitlines() == [
+            f"Renaming: {current} -> {new}" for current, new in plan
+        ]
+
+        restore_files(temp_dir)
+
+        for i in range(1, count + 1):
+            assert (temp_dir / f"Episode {i} - Title.mkv").exists()
+
+    def test_build_rename_plan(
+        self, temp_dir: Path, sample_episode_files: list[Path]
+    ) -> None:
+        """Test that planning lists renames without touching the files."""
+        season_map = {1: (1, 4), 2: (5, 7), 3: (8, 10)}
+
+        plan, warnings = build_rename_plan(temp_dir, season_map)
+
+        assert warnings == []
+        assert sorted(plan) == sorted(
+            [
+                ("Episode 1 - My First Episode.mkv", "S01E01 - My First Episode.mkv"),
+                ("Episode 2 - My Second Episode.mkv", "S01E02 - My Second Episode.mkv"),
+                ("Episode 3 - My Third Episode.mkv", "S01E03 - My Third Episode.mkv"),
+                ("Episode 4 - My Fourth Episode.mkv", "S01E04 - My Fourth Episode.mkv"),
+                ("Episode 5 - My Fifth Episode.mkv", "S02E01 - My Fifth Episode.mkv"),
+                ("Episode 6 - My Sixth Episode.mkv", "S02E02 - My Sixth Episode.mkv"),
+                (
+                    "Episode 7 - My Seventh Episode.mkv",
+                    "S02E03 - My Seventh Episode.mkv",
+                ),
+                ("Episode 8 - My Eighth Episode.mkv", "S03E01 - My Eighth Episode.mkv"),
+                ("Episode 9 - My Ninth Episode.mkv", "S03E02 - My Ninth Episode.mkv"),
+                ("Episode 10 - My Tenth Episode.mkv", "S03E03 - My Tenth Episode.mkv"),
+            ]
+        )
+        for file_path in sample_episode_files:
+            assert file_path.exists()
+
+    def test_rename_episode_files_duplicate_target(self, temp_dir: Path) -> None:
+        """Test that two files mapping to the same name don't overwrite each other."""
+        (temp_dir / "Episode 1 - Title.mkv").write_text("first")
+        (temp_dir / "1 - Title.mkv").write_text("second")
+
+        plan, warnings = build_rename_plan(temp_dir, {1: (1, 5)})
+
+        assert len(plan) == 1
+        assert len(warnings) == 1
+        assert "is also being renamed to 'S01E01 - Title.mkv'" in warnings[0]
+
+        rename_episode_files(temp_dir, {1: (1, 5)})
+
+        # One file is renamed, the other is left alone rather than overwriting it
+        assert (temp_dir / "S01E01 - Title.mkv").exists()
+        assert len(list(temp_dir.glob("*.mkv"))) == 2
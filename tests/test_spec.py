@@ -0,0 +1,81 @@
+"""Tests for anifix spec file parsing."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+
+class TestParseSpecFile:
+    """Tests for parse_spec_file function."""
+
+    def test_parse_valid_spec_file(
+        self,
+        anifix_spec: Callable[[Path], dict[int, tuple[int, int]]],
+        sample_spec_file_ro: Path,
+    ) -> None:
+        """Test parsing a valid spec file."""
+        result = anifix_spec(sample_spec_file_ro)
+
+        expected = {
+            1: (1, 4),
+            2: (5, 7),
+            3: (8, 10),
+        }
+        assert result == expected
+
+    def test_parse_spec_file_with_single_episode(
+        self, anifix_spec: Callable[[Path], dict[int, tuple[int, int]]], temp_dir: Path
+    ) -> None:
+        """Test parsing spec file with single episode seasons."""
+        spec_content = """# Season | Episode range
+1 | 5
+2 | 10"""
+        spec_file = temp_dir / "anifix.spec"
+        spec_file.write_text(spec_content)
+
+        result = anifix_spec(spec_file)
+        expected = {1: (5, 5), 2: (10, 10)}
+        assert result == expected
+
+    def test_parse_spec_file_with_comments_and_empty_lines(
+        self, anifix_spec: Callable[[Path], dict[int, tuple[int, int]]], temp_dir: Path
+    ) -> None:
+        """Test parsing spec file with comments and empty lines."""
+        spec_content = """# This is a comment
+# Another comment
+
+1 | 1-5
+
+# More comments
+2 | 6-10
+
+"""
+        spec_file = temp_dir / "anifix.spec"
+        spec_file.write_text(spec_content)
+
+        result = anifix_spec(spec_file)
+        expected = {1: (1, 5), 2: (6, 10)}
+        assert result == expected
+
+    def test_parse_nonexistent_spec_file(
+        self, anifix_spec: Callable[[Path], dict[int, tuple[int, int]]], temp_dir: Path
+    ) -> None:
+        """Test parsing a nonexistent spec file."""
+        nonexistent_file = temp_dir / "nonexistent.spec"
+
+        with pytest.raises(FileNotFoundError, match="Spec file not found"):
+            anifix_spec(nonexistent_file)
+
+    def test_parse_invalid_spec_file(
+        self, anifix_spec: Callable[[Path], dict[int, tuple[int, int]]], temp_dir: Path
+    ) -> None:
+        """Test parsing an invalid spec file."""
+        spec_content = "invalid content without proper format"
+        spec_file = temp_dir / "anifix.spec"
+        spec_file.write_text(spec_content)
+
+        with pytest.raises(
+            ValueError, match="Invalid format. Expected 'season \\| episode_range'"
+        ):
+            anifix_spec(spec_file)
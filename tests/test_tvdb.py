@@ -6,6 +6,10 @@ from unittest.mock import Mock, patch
 import pytest
 
 from anifix.core import handle_url_spec
+from anifix.errors import AnifixError
+from anifix.tvdb import print_tvdb_info, scrape_tvdb_seasons
+
+TVDB_SERIES_URL = "https://www.thetvdb.com/series/test-series"
 
 
 class MockResponse:
@@ -92,6 +96,9 @@ class TestTVDBScraping:
                 "https://www.thetvdb.com/series/one-piece/seasons/official/1",
                 "one-piece",
             ),
+            ("https://thetvdb.com/deriving/series/12345", "12345"),
+            ("https://www.thetvdb.com/series/the-sandman?tab=seasons", "the-sandman"),
+            ("https://www.thetvdb.com/series/the-sandman#seasons", "the-sandman"),
         ]
 
         for url, expected_id in test_cases:
@@ -132,12 +139,45 @@ class TestTVDBScraping:
         with pytest.raises(ValueError, match="Could not find seasons table"):
             _parse_seasons_table(soup)
 
+    @pytest.mark.parametrize("count_text", ["", "0", "²", "12a"])
+    def test_season_with_episode_count_rejects_non_counts(
+        self, count_text: str
+    ) -> None:
+        """Test that empty, zero and non-decimal episode counts are skipped."""
+        from anifix.tvdb import _season_with_episode_count
+
+        assert _season_with_episode_count(1, count_text) is None
+
+    def test_parse_seasons_tree(self, sample_tvdb_html: str) -> None:
+        """Test parsing TVDB seasons table with selectolax."""
+        pytest.importorskip("selectolax")
+        from selectolax.lexbor import LexborHTMLParser
+
+        from anifix.tvdb import _parse_seasons_tree
+
+        result = _parse_seasons_tree(LexborHTMLParser(sample_tvdb_html))
+
+        expected = [(1, 11), (2, 12)]
+        assert result == expected
+
+    def test_parse_seasons_tree_no_table(self) -> None:
+        """Test selectolax error handling when no seasons table is found."""
+        pytest.importorskip("selectolax")
+        from selectolax.lexbor import LexborHTMLParser
+
+        from anifix.tvdb import _parse_seasons_tree
+
+        tree = LexborHTMLParser("<div>No table here</div>")
+
+        with pytest.raises(ValueError, match="Could not find seasons table"):
+            _parse_seasons_tree(tree)
+
     def test_generate_season_map_from_tvdb(self, sample_tvdb_html: str) -> None:
         """Test generating season map from TVDB data."""
         pytest.importorskip("requests")
         pytest.importorskip("bs4")
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = MockResponse(sample_tvdb_html)
 
             from anifix.tvdb import generate_season_map_from_tvdb
@@ -149,12 +189,105 @@ class TestTVDBScraping:
             expected = {1: (1, 11), 2: (12, 23)}
             assert result == expected
 
+    def test_scrape_tvdb_seasons_cached(self, sample_tvdb_html: str) -> None:
+        """Test that repeated scrapes of the same URL only fetch once."""
+        pytest.importorskip("requests")
+        pytest.importorskip("bs4")
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = MockResponse(sample_tvdb_html)
+
+            url = "https://www.thetvdb.com/series/test-series"
+            first = scrape_tvdb_seasons(url)
+            second = scrape_tvdb_seasons(url)
+
+            assert first == second == ((1, 11), (2, 12))
+            mock_get.assert_called_once()
+
+    def test_scrape_tvdb_seasons_disk_cache(self, sample_tvdb_html: str) -> None:
+        """Test that a fetched page is reused from disk by a later run."""
+        pytest.importorskip("requests")
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = MockResponse(sample_tvdb_html)
+
+            url = "https://www.thetvdb.com/series/test-series"
+            first = scrape_tvdb_seasons(url)
+            scrape_tvdb_seasons.cache_clear()  # As if anifix was run again
+            second = scrape_tvdb_seasons(url)
+
+            assert first == second == ((1, 11), (2, 12))
+            mock_get.assert_called_once()
+
+    def test_scrape_tvdb_seasons_disk_cache_private(
+        self, tmp_path: Path, sample_tvdb_html: str
+    ) -> None:
+        """Test that the cache directory is only accessible to the current user."""
+        pytest.importorskip("requests")
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = MockResponse(sample_tvdb_html)
+            scrape_tvdb_seasons("https://www.thetvdb.com/series/test-series")
+
+        assert (tmp_path / "tvdb-cache").stat().st_mode & 0o777 == 0o700
+
+    def test_scrape_tvdb_seasons_disk_cache_expired(
+        self, monkeypatch: pytest.MonkeyPatch, sample_tvdb_html: str
+    ) -> None:
+        """Test that a cached page older than the TTL is fetched again."""
+        pytest.importorskip("requests")
+        monkeypatch.setattr("anifix.tvdb.TVDB_CACHE_TTL", 0)
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = MockResponse(sample_tvdb_html)
+
+            url = "https://www.thetvdb.com/series/test-series"
+            scrape_tvdb_seasons(url)
+            scrape_tvdb_seasons.cache_clear()
+            scrape_tvdb_seasons(url)
+
+            assert mock_get.call_count == 2
+
+    def test_scrape_tvdb_seasons_disk_cache_unparseable(
+        self, tmp_path: Path, sample_tvdb_html: str
+    ) -> None:
+        """Test that a cached page that doesn't parse is dropped and fetched again."""
+        pytest.importorskip("requests")
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = MockResponse(sample_tvdb_html)
+
+            url = "https://www.thetvdb.com/series/test-series"
+            scrape_tvdb_seasons(url)
+            scrape_tvdb_seasons.cache_clear()
+            (cache_file,) = (tmp_path / "tvdb-cache").iterdir()
+            cache_file.write_bytes(b"<html><p>Not a seasons table</p></html>")
+
+            assert scrape_tvdb_seasons(url) == ((1, 11), (2, 12))
+            assert mock_get.call_count == 2
+            assert cache_file.read_bytes() == sample_tvdb_html.encode()
+
+    def test_scrape_tvdb_seasons_without_selectolax(
+        self, monkeypatch: pytest.MonkeyPatch, sample_tvdb_html: str
+    ) -> None:
+        """Test that scraping falls back to BeautifulSoup without selectolax."""
+        pytest.importorskip("requests")
+        pytest.importorskip("bs4")
+        monkeypatch.setattr("anifix.tvdb.SELECTOLAX_AVAILABLE", False)
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = MockResponse(sample_tvdb_html)
+
+            result = scrape_tvdb_seasons("https://www.thetvdb.com/series/test-series")
+
+            assert result == ((1, 11), (2, 12))
+
     def test_generate_spec_from_tvdb(self, sample_tvdb_html: str) -> None:
         """Test generating spec file content from TVDB data."""
         pytest.importorskip("requests")
         pytest.importorskip("bs4")
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = MockResponse(sample_tvdb_html)
 
             from anifix.tvdb import generate_spec_from_tvdb
@@ -172,6 +305,25 @@ class TestTVDBScraping:
             expected = "\n".join(expected_lines)
             assert result == expected
 
+    def test_generate_spec_from_tvdb_repeated_season(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a season number listed twice by TVDB keeps both ranges."""
+        from anifix.tvdb import generate_spec_from_tvdb
+
+        monkeypatch.setattr(
+            "anifix.tvdb.scrape_tvdb_seasons", lambda _: ((1, 3), (1, 4), (2, 2))
+        )
+
+        result = generate_spec_from_tvdb(TVDB_SERIES_URL)
+        assert result == "# Season | Episode range\n1 | 1-3\n1 | 4-7\n2 | 8-9\n"
+
+        print_tvdb_info(TVDB_SERIES_URL)
+        output = capsys.readouterr().out
+        assert "Found 3 season(s):" in output
+        assert "Season 1: 3 episodes (would map to episodes 1-3)" in output
+        assert "Season 1: 4 episodes (would map to episodes 4-7)" in output
+
     def test_generate_spec_from_tvdb_with_output_file(
         self, sample_tvdb_html: str, temp_dir: Path
     ) -> None:
@@ -179,7 +331,7 @@ class TestTVDBScraping:
         pytest.importorskip("requests")
         pytest.importorskip("bs4")
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = MockResponse(sample_tvdb_html)
 
             from anifix.tvdb import generate_spec_from_tvdb
@@ -209,9 +361,22 @@ class TestTVDBScraping:
         with patch("anifix.tvdb.SCRAPING_AVAILABLE", False):
             from anifix.tvdb import check_scraping_dependencies
 
-            with pytest.raises(SystemExit):
+            with pytest.raises(AnifixError, match="requires additional dependencies"):
                 check_scraping_dependencies()
 
+    def test_print_tvdb_info_without_dependencies(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that print_tvdb_info shows the install hint when dependencies are missing."""
+        with (
+            patch("anifix.tvdb.SCRAPING_AVAILABLE", new=False),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            print_tvdb_info("https://www.thetvdb.com/series/test")
+
+        assert exc_info.value.code == 1
+        assert "requires additional dependencies" in capsys.readouterr().out
+
     def test_handle_url_spec_without_dependencies(self) -> None:
         """Test handle_url_spec when dependencies are missing."""
         # Create a mock args object
@@ -220,7 +385,7 @@ class TestTVDBScraping:
 
         # Mock the SCRAPING_AVAILABLE flag to simulate missing dependencies
         with patch("anifix.tvdb.SCRAPING_AVAILABLE", new=False):
-            with pytest.raises(SystemExit):
+            with pytest.raises(AnifixError):
                 handle_url_spec(mock_args)
 
     def test_handle_url_spec_with_dependencies(self, sample_tvdb_html: str) -> None:
@@ -232,7 +397,7 @@ class TestTVDBScraping:
         mock_args = Mock()
         mock_args.url_spec = "https://www.thetvdb.com/series/test-series"
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = MockResponse(sample_tvdb_html)
 
             result = handle_url_spec(mock_args)
@@ -262,7 +427,7 @@ class TestTVDBIntegration:
         for filename in test_files:
             (temp_dir / filename).touch()
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = MockResponse(sample_tvdb_html)
 
             from anifix.renamer import rename_episode_files